@@ -25,6 +25,7 @@ import sys
 import json
 import sqlite3
 import logging
+from itertools import groupby
 from datetime import datetime, timezone, timedelta
 from zoneinfo import ZoneInfo
 
@@ -87,20 +88,30 @@ def get_archivable_streams(conn, table: str, threshold_days: int) -> list[dict]:
         return cur.fetchall()
 
 
-def get_timeseries(conn, table: str, video_id: str) -> list[dict]:
+def iter_timeseries_for_streams(conn, table: str, video_ids: list[str]):
+    """
+    Per-sample rows (collected_at, concurrent_viewers, view_count, like_count,
+    comment_count) for every requested video in *table* from one query,
+    yielding (video_id, rows) per video in collected_at order.
+    Videos with no rows are not yielded.
+    """
+    if not video_ids:
+        return
     with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
         cur.execute(f"""
             SELECT
+                video_id,
                 collected_at,
                 concurrent_viewers,
                 view_count,
                 like_count,
                 comment_count
             FROM {table}
-            WHERE video_id = %s
-            ORDER BY collected_at
-        """, (video_id,))
-        return cur.fetchall()
+            WHERE video_id = ANY(%s)
+            ORDER BY video_id, collected_at
+        """, (list(video_ids),))
+        for vid, rows in groupby(cur, key=lambda r: r["video_id"]):
+            yield vid, list(rows)
 
 
 # ── SQLite helpers ────────────────────────────────────────────────────────────
@@ -139,8 +150,13 @@ def init_sqlite(path: str) -> sqlite3.Connection:
             comment_count       INTEGER
         );
 
-        CREATE INDEX IF NOT EXISTS idx_ts_video_id
-            ON timeseries(video_id);
+        -- (video_id, collected_at) lets the dashboard's per-channel
+        -- "WHERE video_id IN (...) ORDER BY video_id, collected_at" read rows
+        -- already in order instead of sorting them; it also covers every
+        -- lookup the old video_id-only index served.
+        CREATE INDEX IF NOT EXISTS idx_ts_video_ts
+            ON timeseries(video_id, collected_at);
+        DROP INDEX IF EXISTS idx_ts_video_id;
 
         CREATE INDEX IF NOT EXISTS idx_streams_channel
             ON streams(channel_name);
@@ -293,12 +309,18 @@ def main():
         log.info("  %s — archiving %d stream(s) (skipping %d already done)",
                  ch_name, len(new_streams), len(streams) - len(new_streams))
 
-        for stream in new_streams:
-            vid = stream["video_id"]
-            ts  = get_timeseries(lconn, table, vid)
-            archive_stream(hist, stream, ch_name, org, ts)
+        # One timeseries query per channel instead of one per stream; each
+        # stream is archived as soon as its rows have been read.
+        by_vid = {s["video_id"]: s for s in new_streams}
+        fetched = iter_timeseries_for_streams(lconn, table, list(by_vid))
+        for vid, ts in fetched:
+            archive_stream(hist, by_vid.pop(vid), ch_name, org, ts)
             log.info("    ✓ %s — %d timeseries rows", vid, len(ts))
             total_archived += 1
+        for vid, stream in by_vid.items():
+            archive_stream(hist, stream, ch_name, org, [])
+            log.info("    ✓ %s — 0 timeseries rows", vid)
+            total_archived += 1
 
         hist.commit()
 
@@ -9,25 +9,37 @@ static HTML dashboard:
 
 Partial build algorithm:
   - A manifest (dashboard/manifest.json) tracks every stream page.
-  - On each run, only stream pages that are NEW or currently LIVE are
-    (re)generated. Their parent channel and org pages are then also
-    regenerated to reflect updated stream counts / card lists.
+  - On each run, only stream pages that are NEW, were LIVE at the last
+    build, whose fingerprint (data_points, last_seen, status) changed, or
+    whose HTML file is missing from the output dir are (re)generated.
+    Their parent channel and org pages are then also regenerated to
+    reflect updated stream counts / card lists.
+  - CI persists only the manifest in git; deploy_dashboard.yml restores
+    the previous HTML from the Actions cache, and a cache miss means every
+    page is missing, i.e. a full rebuild.
   - The index page is always regenerated (trivially cheap).
-  - Unchanged stream pages (VOD, already in manifest) are never touched.
+  - Unchanged stream pages (fingerprint matches the manifest) are never
+    touched — no timeseries fetch, no render.
 
 Org membership is driven by the ORG_MAP dict below.
 """
 
 import os
 import re
+import gzip
 import json
 import shutil
+import hashlib
 import sqlite3
 import logging
+import threading
+import multiprocessing
 from collections import OrderedDict
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
 from datetime import datetime, timezone, timedelta
 from functools import lru_cache
+from itertools import groupby
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
@@ -38,6 +50,8 @@ def _now_local() -> datetime:
 
 import psycopg2
 import psycopg2.extras
+import psycopg2.pool
+from psycopg2 import sql
 
 try:
     from googleapiclient.discovery import build as yt_build
@@ -46,6 +60,18 @@ try:
 except ImportError:
     _YT_AVAILABLE = False
 
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
+try:
+    import minify_html
+    _MINIFY_AVAILABLE = True
+except ImportError:
+    _MINIFY_AVAILABLE = False
+
 # ── logging ───────────────────────────────────────────────────────────────────
 logging.basicConfig(
     level=logging.INFO,
@@ -62,6 +88,19 @@ HISTORY_DB_PATH    = os.environ.get(
     str(Path(__file__).parent.parent / "idvt-history" / "history.db")
 )
 MANIFEST_PATH      = OUTPUT_DIR / "manifest.json"
+# Upper bound on points embedded per stream chart; longer series are
+# LTTB-downsampled. Peak/avg KPIs are always computed from the full series.
+CHART_MAX_POINTS   = int(os.environ.get("CHART_MAX_POINTS", "1000"))
+# Stream-page rendering is pure-Python CPU work that threads cannot spread
+# across cores. At or above this many dirty pages (first build, manifest
+# reset) rendering moves to a process pool; typical partial builds with a
+# handful of live pages stay in-process, where spawning workers would cost
+# more than it saves.
+PROCESS_RENDER_MIN = int(os.environ.get("PROCESS_RENDER_MIN", "64"))
+# Also write a precompressed {page}.html.gz next to every page, for hosts that
+# serve static gzip (nginx gzip_static, Caddy precompressed). Off by default:
+# GitHub Pages compresses on the fly and ignores the sidecars.
+GZIP_OUTPUT        = os.environ.get("DASHBOARD_GZIP", "").lower() in ("1", "true", "yes")
 
 
 # ── org definitions ───────────────────────────────────────────────────────────
@@ -448,7 +487,8 @@ for _slug, _org in ORG_MAP.items():
 def load_manifest() -> dict:
     """
     Returns the manifest dict, keyed by video_id.
-    Each entry: {org_slug, ch_slug, ch_name, status, generated_at}
+    Each entry: {org_slug, ch_slug, ch_name, status, generated_at,
+                 data_points, last_seen}
     """
     if MANIFEST_PATH.exists():
         try:
@@ -458,6 +498,36 @@ def load_manifest() -> dict:
     return {}
 
 
+def _stream_fingerprint(stream: dict) -> dict:
+    """
+    The summary fields that change whenever a stream's page content would:
+    new samples bump data_points / last_seen, and status flips on
+    upcoming → live → vod. Stored in the manifest next to each entry.
+    """
+    last_seen = stream.get("last_seen")
+    if isinstance(last_seen, datetime):
+        last_seen = last_seen.isoformat()
+    return {
+        "status":      stream.get("stream_status") or "vod",
+        "data_points": int(stream.get("data_points") or 0),
+        "last_seen":   str(last_seen) if last_seen is not None else None,
+    }
+
+
+def _manifest_is_stale(entry: dict | None, stream: dict) -> bool:
+    """
+    True when the stream page must be (re)generated: never built, built
+    while live, or its fingerprint no longer matches. Entries written before
+    fingerprints were recorded fall back to the live-only rule.
+    """
+    if entry is None or entry.get("status") == "live":
+        return True
+    if "data_points" not in entry:
+        return False
+    fp = _stream_fingerprint(stream)
+    return any(entry.get(k) != v for k, v in fp.items())
+
+
 def save_manifest(manifest: dict) -> None:
     """Write manifest atomically via a temp file so a mid-write crash can never
     corrupt the file and cause 'Manifest unreadable' warnings on the next run."""
@@ -476,12 +546,65 @@ def save_manifest(manifest: dict) -> None:
 # DB HELPERS
 # ══════════════════════════════════════════════════════════════════════════════
 
-def get_conn():
-    return psycopg2.connect(
-        AIVEN_DATABASE_URL,
-        sslmode="require",
-        options="-c search_path=public -c statement_timeout=30000",
-    )
+# libpq keepalives stop Aiven from silently dropping sockets that sit idle
+# while pages are being rendered between queries.
+_CONN_KWARGS = dict(
+    sslmode="require",
+    options="-c search_path=public -c statement_timeout=30000",
+    keepalives=1,
+    keepalives_idle=30,
+    keepalives_interval=10,
+    keepalives_count=3,
+    application_name="dashboard-gen",
+)
+DB_POOL_MAX = 8   # sized to the page-generation thread pools below
+
+_pool: psycopg2.pool.ThreadedConnectionPool | None = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> psycopg2.pool.ThreadedConnectionPool:
+    """
+    Lazily create the process-wide connection pool. Created on first use
+    rather than at import time so archiver.py can import ORG_MAP from this
+    module without touching the database.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = psycopg2.pool.ThreadedConnectionPool(
+                1, DB_POOL_MAX, AIVEN_DATABASE_URL, **_CONN_KWARGS
+            )
+        return _pool
+
+
+@contextmanager
+def pooled_conn():
+    """
+    Borrow a connection from the pool and always hand it back. Connections
+    that broke mid-use are discarded instead of being returned for reuse;
+    an open transaction is rolled back by the pool on return.
+    """
+    pool = _get_pool()
+    conn = pool.getconn()
+    try:
+        yield conn
+    finally:
+        pool.putconn(conn, close=bool(conn.closed))
+
+
+def close_pool() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.closeall()
+            _pool = None
+
+
+# Shape of the names tracker.get_table_name() produces. Table names come
+# from the channels registry, so anything else is rejected before it can
+# reach a query.
+_TABLE_NAME_RE = re.compile(r"^[a-z_][a-z0-9_]*$")
 
 
 def get_channel_rows(conn) -> list[dict]:
@@ -490,7 +613,15 @@ def get_channel_rows(conn) -> list[dict]:
             "SELECT channel_id, channel_name, table_name, added_at "
             "FROM channels ORDER BY channel_name"
         )
-        return cur.fetchall()
+        rows = cur.fetchall()
+    valid = []
+    for row in rows:
+        if _TABLE_NAME_RE.match(row["table_name"] or ""):
+            valid.append(row)
+        else:
+            log.warning("Ignoring channel '%s': invalid table name %r.",
+                        row["channel_name"], row["table_name"])
+    return valid
 
 
 _schema_cache: dict[str, dict] = {}  # table_name → {exists, has_view_count}
@@ -554,17 +685,103 @@ def _has_column(conn, table: str, column: str) -> bool:
     return _schema_cache[table]["has_view_count"]
 
 
-def get_streams_for_channel(conn, table: str) -> list[dict]:
-    if not _table_exists(conn, table):
-        log.warning("Table '%s' does not exist yet — skipping.", table)
-        return []
-    view_count_expr = (
+def _ts_index_name(table: str) -> str:
+    # Postgres truncates identifiers to 63 bytes; use the stored form so the
+    # existence check below matches what CREATE INDEX actually created.
+    return f"idx_{table}_vid_ts"[:63]
+
+
+def _legacy_vid_index_name(table: str) -> str:
+    # Single-column video_id index tracker.init_channel_table() used to create.
+    return f"idx_{table}_video_id"[:63]
+
+
+def ensure_indexes(conn, tables: list[str]) -> None:
+    """
+    Make sure every channel table has the covering (video_id, collected_at)
+    index the timeseries queries rely on: WHERE video_id = ANY(...) ordered
+    by collected_at, reading only the INCLUDEd metric columns, becomes an
+    index-only scan instead of a heap scan + sort.
+
+    One catalogue query finds which tables still lack a valid index; only
+    those get a CREATE INDEX CONCURRENTLY (so the tracker's inserts are never
+    blocked). An INVALID leftover from an interrupted build is dropped and
+    rebuilt. Once a table's covering index is valid, the old single-column
+    video_id index is redundant (its column leads the covering one) and is
+    dropped, also CONCURRENTLY, so inserts stop maintaining both. Failures
+    (e.g. missing privileges) are logged and skipped — the indexes are an
+    optimisation, not a requirement.
+    """
+    tables = [t for t in tables if _table_exists(conn, t)]
+    if not tables:
+        return
+    names  = {t: _ts_index_name(t) for t in tables}
+    legacy = {t: _legacy_vid_index_name(t) for t in tables}
+    with conn.cursor() as cur:
+        cur.execute("""
+            SELECT c.relname, i.indisvalid
+            FROM pg_index i
+            JOIN pg_class c     ON c.oid = i.indexrelid
+            JOIN pg_namespace n ON n.oid = c.relnamespace
+            WHERE n.nspname = 'public' AND c.relname = ANY(%s)
+        """, (list(names.values()) + list(legacy.values()),))
+        state = dict(cur.fetchall())
+    missing = [t for t in tables if not state.get(names[t])]
+    if not missing and not any(legacy[t] in state for t in tables):
+        return
+
+    if missing:
+        log.info("Creating covering timeseries index on %d table(s)…", len(missing))
+    was_autocommit = conn.autocommit
+    if not was_autocommit:
+        conn.commit()   # CONCURRENTLY cannot run inside a transaction block
+        conn.autocommit = True
+    try:
+        covered = {t for t in tables if state.get(names[t])}
+        for table in missing:
+            idx = names[table]
+            try:
+                with conn.cursor() as cur:
+                    if idx in state:   # present but INVALID
+                        cur.execute(sql.SQL("DROP INDEX CONCURRENTLY IF EXISTS {}")
+                                    .format(sql.Identifier(idx)))
+                    cur.execute(sql.SQL("""
+                        CREATE INDEX CONCURRENTLY IF NOT EXISTS {idx}
+                            ON {t} (video_id, collected_at)
+                            INCLUDE (concurrent_viewers, like_count, comment_count)
+                    """).format(idx=sql.Identifier(idx), t=sql.Identifier(table)))
+                covered.add(table)
+            except psycopg2.Error as e:
+                log.warning("Could not create index %s: %s", idx, e)
+        for table in tables:
+            idx = legacy[table]
+            if idx not in state or table not in covered:
+                continue
+            try:
+                with conn.cursor() as cur:
+                    cur.execute(sql.SQL("DROP INDEX CONCURRENTLY IF EXISTS {}")
+                                .format(sql.Identifier(idx)))
+                log.info("Dropped redundant index %s.", idx)
+            except psycopg2.Error as e:
+                log.warning("Could not drop index %s: %s", idx, e)
+    finally:
+        conn.autocommit = was_autocommit
+
+
+def _view_count_expr(conn, table: str) -> sql.SQL:
+    return sql.SQL(
         "MAX(view_count) AS view_count"
         if _has_column(conn, table, "view_count")
         else "NULL::BIGINT AS view_count"
     )
+
+
+def get_streams_for_channel(conn, table: str) -> list[dict]:
+    if not _table_exists(conn, table):
+        log.warning("Table '%s' does not exist yet — skipping.", table)
+        return []
     with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
-        cur.execute(f"""
+        cur.execute(sql.SQL("""
             SELECT
                 video_id,
                 MAX(video_title)        AS video_title,
@@ -576,10 +793,10 @@ def get_streams_for_channel(conn, table: str) -> list[dict]:
                 MAX(like_count)         AS peak_likes,
                 MAX(comment_count)      AS peak_comments,
                 COUNT(*)                AS data_points
-            FROM {table}
+            FROM {t}
             GROUP BY video_id
             ORDER BY first_seen DESC
-        """)
+        """).format(view_count_expr=_view_count_expr(conn, table), t=sql.Identifier(table)))
         return cur.fetchall()
 
 
@@ -602,12 +819,7 @@ def get_all_streams_bulk(conn, table_infos: list[tuple[str, str]]) -> dict[str,
     parts = []
     for idx, (ch_name, table) in enumerate(table_infos):
         idx_to_ch.append(ch_name)
-        view_count_expr = (
-            "MAX(view_count) AS view_count"
-            if _has_column(conn, table, "view_count")
-            else "NULL::BIGINT AS view_count"
-        )
-        parts.append(f"""
+        parts.append(sql.SQL("""
             SELECT
                 {idx} AS ch_idx,
                 video_id,
@@ -620,11 +832,15 @@ def get_all_streams_bulk(conn, table_infos: list[tuple[str, str]]) -> dict[str,
                 MAX(like_count)         AS peak_likes,
                 MAX(comment_count)      AS peak_comments,
                 COUNT(*)                AS data_points
-            FROM {table}
+            FROM {t}
             GROUP BY video_id
-        """)
+        """).format(
+            idx=sql.Literal(idx),
+            view_count_expr=_view_count_expr(conn, table),
+            t=sql.Identifier(table),
+        ))
 
-    union_sql = " UNION ALL ".join(parts) + " ORDER BY ch_idx, first_seen DESC"
+    union_sql = sql.SQL(" UNION ALL ").join(parts) + sql.SQL(" ORDER BY ch_idx, first_seen DESC")
 
     with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
         cur.execute(union_sql)
@@ -638,25 +854,43 @@ def get_all_streams_bulk(conn, table_infos: list[tuple[str, str]]) -> dict[str,
     return result
 
 
-def get_stream_timeseries(conn, table: str, video_id: str) -> list[dict]:
-    with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
-        cur.execute(f"""
-            SELECT collected_at, concurrent_viewers, like_count, comment_count
-            FROM {table}
-            WHERE video_id = %s
-            ORDER BY collected_at
-        """, (video_id,))
-        return cur.fetchall()
-
-
-def get_all_rows(conn, table: str, video_id: str) -> list[dict]:
-    with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
-        cur.execute(f"""
-            SELECT * FROM {table}
-            WHERE video_id = %s
-            ORDER BY collected_at DESC
-        """, (video_id,))
-        return cur.fetchall()
+def iter_timeseries_for_channel(conn, table: str, video_ids: list[str],
+                                itersize: int = 50):
+    """
+    Stream the chart series for every requested video in *table* from a
+    single query, yielding (video_id, series) as rows arrive.
+
+    Postgres packs each video's samples into ordered arrays (array_agg …
+    ORDER BY collected_at), already formatted as WIB HH:MM labels and with
+    NULL counts coalesced to 0, so there is one row per video rather than
+    one row per sample.  A server-side (named) cursor fetches *itersize*
+    videos at a time, so callers can render each page as its series arrives
+    without buffering the whole channel.  Videos with no rows are not yielded.
+    series is {labels, viewers, likes, comments}.
+    """
+    if not video_ids:
+        return
+    with conn.cursor(name=f"ts_{table}") as cur:
+        cur.itersize = itersize
+        cur.execute(sql.SQL("""
+            SELECT
+                video_id,
+                array_agg(to_char(collected_at AT TIME ZONE 'Asia/Jakarta', 'HH24:MI')
+                          ORDER BY collected_at)                         AS labels,
+                array_agg(COALESCE(concurrent_viewers, 0) ORDER BY collected_at) AS viewers,
+                array_agg(COALESCE(like_count, 0)         ORDER BY collected_at) AS likes,
+                array_agg(COALESCE(comment_count, 0)      ORDER BY collected_at) AS comments
+            FROM {t}
+            WHERE video_id = ANY(%s)
+            GROUP BY video_id
+        """).format(t=sql.Identifier(table)), (list(video_ids),))
+        for vid, labels, viewers, likes, comments in cur:
+            yield vid, {
+                "labels":   labels,
+                "viewers":  viewers,
+                "likes":    likes,
+                "comments": comments,
+            }
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -664,14 +898,29 @@ def get_all_rows(conn, table: str, video_id: str) -> list[dict]:
 # ══════════════════════════════════════════════════════════════════════════════
 
 def get_history_conn():
+    """
+    Open history.db read-only. The dashboard never writes to the archive
+    (archiver.py owns it and its WAL journal mode), so the file is opened
+    with mode=ro + query_only, and reads go through a memory map and a
+    larger page cache instead of a read() syscall per page. One connection
+    is opened per worker thread, so no shared cache.
+    """
     path = HISTORY_DB_PATH
     if not os.path.exists(path):
         log.info("history.db not found at %s — archived streams will not be shown.", path)
         return None
     try:
-        conn = sqlite3.connect(path)
+        # check_same_thread=False only so build_dashboard can close worker
+        # threads' connections after the pool exits; each is used by one thread.
+        conn = sqlite3.connect(f"{Path(path).resolve().as_uri()}?mode=ro", uri=True,
+                               check_same_thread=False)
         conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript("""
+            PRAGMA query_only   = 1;
+            PRAGMA mmap_size    = 1073741824;
+            PRAGMA cache_size   = -32768;
+            PRAGMA temp_store   = MEMORY;
+        """)
         return conn
     except Exception as e:
         log.warning("Could not open history.db: %s", e)
@@ -747,26 +996,94 @@ def get_all_archived_streams(hist, channel_names: list[str]) -> dict[str, list]:
     return result
 
 
-def get_archived_timeseries(hist, video_id: str) -> list:
+def get_archived_timeseries(hist, video_id: str) -> list[tuple]:
+    """Rows of (collected_at, concurrent_viewers, like_count, comment_count)."""
     rows = hist.execute("""
         SELECT collected_at, concurrent_viewers, like_count, comment_count
         FROM timeseries
         WHERE video_id = ?
         ORDER BY collected_at
     """, (video_id,)).fetchall()
+    return _parse_archived_rows(rows)
+
 
+def _parse_archived_rows(rows) -> list[tuple]:
+    """history.db stores collected_at as ISO text; parse it back to datetime."""
     result = []
-    for r in rows:
-        d = dict(r)
-        if isinstance(d.get("collected_at"), str):
+    for collected_at, viewers, likes, comments in rows:
+        if isinstance(collected_at, str):
             try:
-                d["collected_at"] = datetime.fromisoformat(d["collected_at"])
+                collected_at = datetime.fromisoformat(collected_at)
             except ValueError:
                 pass
-        result.append(d)
+        result.append((collected_at, viewers, likes, comments))
     return result
 
 
+# SQLite's default SQLITE_MAX_VARIABLE_NUMBER is 999 on older builds.
+_SQLITE_BATCH = 500
+
+
+def iter_archived_timeseries(hist, video_ids: list[str]):
+    """
+    Archived counterpart of iter_timeseries_for_channel(): one query per
+    _SQLITE_BATCH video_ids instead of one per video, yielding
+    (video_id, series) per video as its rows are grouped off the cursor.
+    Videos with no rows are not yielded.
+
+    As on the Postgres side, SQLite formats the WIB HH:MM labels and
+    coalesces NULL counts, so no Python datetime parsing or fmt_dt() runs
+    per sample. Asia/Jakarta has had no DST since 1964, so a fixed
+    '+7 hours' shift matches fmt_dt(); naive timestamps are taken as UTC
+    there too, and unparseable ones fall back to their first 16 chars.
+    Fractional seconds are cut off before strftime(), which would otherwise
+    round …:59.9995 up into the next minute where fmt_dt() truncates.
+    """
+    for i in range(0, len(video_ids), _SQLITE_BATCH):
+        batch = video_ids[i:i + _SQLITE_BATCH]
+        cur = hist.execute(f"""
+            SELECT
+                video_id,
+                COALESCE(strftime('%H:%M',
+                                  CASE WHEN substr(collected_at, 20, 1) = '.'
+                                       THEN substr(collected_at, 1, 19)
+                                            || ltrim(substr(collected_at, 21), '0123456789')
+                                       ELSE collected_at END,
+                                  '+7 hours'),
+                         substr(collected_at, 1, 16)),
+                COALESCE(concurrent_viewers, 0),
+                COALESCE(like_count, 0),
+                COALESCE(comment_count, 0)
+            FROM timeseries
+            WHERE video_id IN ({",".join("?" * len(batch))})
+            ORDER BY video_id, collected_at
+        """, batch)
+        for vid, group in groupby(cur, key=lambda r: r[0]):
+            _, labels, viewers, likes, comments = map(list, zip(*group))
+            yield vid, {
+                "labels":   labels,
+                "viewers":  viewers,
+                "likes":    likes,
+                "comments": comments,
+            }
+
+
+def _series_from_rows(rows: list) -> dict:
+    """
+    Convert per-sample history.db timeseries tuples into the columnar chart
+    series shape yielded by iter_timeseries_for_channel().
+    """
+    labels, viewers, likes, comments = [], [], [], []
+    add_l, add_v, add_k, add_c = labels.append, viewers.append, likes.append, comments.append
+    # one pass over the rows instead of four comprehensions
+    for collected_at, cv, lc, cc in rows:
+        add_l(fmt_dt(collected_at, time_only=True))
+        add_v(int(cv or 0))
+        add_k(int(lc or 0))
+        add_c(int(cc or 0))
+    return {"labels": labels, "viewers": viewers, "likes": likes, "comments": comments}
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 # LOGO / SUBSCRIBER CACHE
 # ══════════════════════════════════════════════════════════════════════════════
@@ -952,9 +1269,12 @@ def get_channel_data(channel_ids: list[str]) -> tuple[dict[str, str], dict[str,
 # UTILITY HELPERS
 # ══════════════════════════════════════════════════════════════════════════════
 
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+
 @lru_cache(maxsize=None)
 def slugify(text: str) -> str:
-    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+    return _SLUG_RE.sub("-", text.lower()).strip("-")
 
 
 def fmt(n) -> str:
@@ -998,7 +1318,10 @@ def fmt_dt(dt, time_only: bool = False) -> str:
             if parsed.tzinfo is None:
                 parsed = parsed.replace(tzinfo=timezone.utc)
             local = parsed.astimezone(_LOCAL_TZ)
-        return local.strftime("%H:%M") if time_only else local.strftime("%Y-%m-%d %H:%M WIB")
+        # isoformat's fixed layout is much cheaper than strftime's format
+        # interpreter: "YYYY-MM-DD HH:MM+07:00" sliced to the wanted fields.
+        iso = local.isoformat(sep=" ", timespec="minutes")
+        return iso[11:16] if time_only else iso[:16] + " WIB"
     except Exception:
         return str(dt)[:16]
 
@@ -1011,6 +1334,77 @@ def esc(s) -> str:
             .replace('"', "&quot;"))
 
 
+# ORG_MAP is fixed for the whole run, so its display strings are escaped once
+# here rather than on every card / hero / breadcrumb that shows them.
+_ORG_ESC: dict[str, dict[str, str]] = {
+    slug: {"label": esc(o["label"]), "desc": esc(o["desc"])}
+    for slug, o in ORG_MAP.items()
+}
+
+
+def _dumps(obj) -> str:
+    """
+    Compact JSON for embedding chart data in <script>. Uses orjson when it
+    is installed (numeric arrays serialise in C); the stdlib fallback emits
+    the same compact form without spaces after separators.
+    """
+    if _ORJSON_AVAILABLE:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def _write_html(path: Path, parts) -> None:
+    """
+    Write a page to *path* piece by piece through one buffered handle,
+    instead of concatenating head + body + foot into a single string first.
+    The file is opened in binary mode with a 256 KiB buffer and each part is
+    UTF-8 encoded directly, bypassing the text-layer codec wrapper; a whole
+    page typically goes out in one write() syscall.
+
+    When minify-html is installed the page is assembled and minified
+    (inline CSS and JS included) before writing. With GZIP_OUTPUT the
+    encoded bytes are also compressed once into *path*.gz (mtime=0, so
+    unchanged pages yield byte-identical archives).
+
+    A page whose bytes match the file already on disk is left untouched
+    (size check first, then a byte compare), keeping its mtime stable for
+    rsync/CDN uploads. Otherwise every file is written to a sibling .tmp and
+    renamed over the target, so an interrupted build never leaves a
+    truncated page behind.
+    """
+    if _MINIFY_AVAILABLE:
+        html = minify_html.minify("".join(parts), minify_css=True, minify_js=True,
+                                  keep_closing_tags=True)
+        chunks = [html.encode("utf-8")]
+    else:
+        chunks = [part.encode("utf-8") for part in parts]
+    gz_path = path.with_name(path.name + ".gz")
+
+    if _file_matches(path, chunks) and (not GZIP_OUTPUT or gz_path.exists()):
+        return
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb", buffering=1 << 18) as fh:
+        fh.writelines(chunks)
+    tmp.replace(path)
+    if GZIP_OUTPUT:
+        _replace_bytes(gz_path, gzip.compress(b"".join(chunks), compresslevel=9, mtime=0))
+
+
+def _file_matches(path: Path, chunks: list[bytes]) -> bool:
+    try:
+        if path.stat().st_size != sum(map(len, chunks)):
+            return False
+        return path.read_bytes() == b"".join(chunks)
+    except OSError:
+        return False
+
+
+def _replace_bytes(path: Path, data: bytes) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    tmp.replace(path)
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 # SHARED CSS + HTML HELPERS
 # ══════════════════════════════════════════════════════════════════════════════
@@ -1124,7 +1518,7 @@ _BASE_CSS = """
   }
   body::before {
     content: ''; position: fixed; inset: 0; pointer-events: none; z-index: 0;
-    background-image: url("data:image/svg+xml,%3Csvg viewBox='0 0 200 200' xmlns='http://www.w3.org/2000/svg'%3E%3Cfilter id='n'%3E%3CfeTurbulence type='fractalNoise' baseFrequency='0.85' numOctaves='4' stitchTiles='stitch'/%3E%3C/filter%3E%3Crect width='100%25' height='100%25' filter='url(%23n)' opacity='0.035'/%3E%3C/svg%3E");
+    background-image: url("noise.svg");
     opacity: 0.5;
   }
   .page { position: relative; z-index: 1; max-width: 1100px; margin: 0 auto; padding: 0 2rem 6rem; }
@@ -1541,6 +1935,34 @@ _BASE_CSS = """
 
 
 
+# Shared assets: _BASE_CSS and the body::before noise texture are written once
+# per build to OUTPUT_DIR/assets/ and linked from every page instead of being
+# inlined, so browsers cache them across navigations. url("noise.svg") in the
+# CSS resolves relative to the stylesheet. The ?v= hash busts caches whenever
+# the CSS changes.
+_ASSETS_DIR  = "assets"
+_NOISE_SVG   = (
+    "<svg viewBox='0 0 200 200' xmlns='http://www.w3.org/2000/svg'>"
+    "<filter id='n'><feTurbulence type='fractalNoise' baseFrequency='0.85'"
+    " numOctaves='4' stitchTiles='stitch'/></filter>"
+    "<rect width='100%' height='100%' filter='url(#n)' opacity='0.035'/></svg>"
+)
+_CSS_VERSION = hashlib.sha1(_BASE_CSS.encode("utf-8")).hexdigest()[:10]
+
+
+def write_assets() -> None:
+    """Write the shared stylesheet + noise texture, skipping unchanged files."""
+    assets = OUTPUT_DIR / _ASSETS_DIR
+    assets.mkdir(parents=True, exist_ok=True)
+    for name, content in (("style.css", _BASE_CSS), ("noise.svg", _NOISE_SVG)):
+        path = assets / name
+        data = content.encode("utf-8")
+        if path.exists() and path.read_bytes() == data:
+            continue
+        path.write_bytes(data)
+        log.info("Written: %s/%s", _ASSETS_DIR, name)
+
+
 _THEME_JS = """
 <script>
 (function() {
@@ -1603,7 +2025,8 @@ def _html_head(title: str, depth: int, org_color: str = "#e8ff47",
         f'<title>{esc(title)} — IDVTuber Tracker</title>\n'
         f'{_FONTS}\n'
         f'{extra_scripts}\n'
-        f'<style>\n{_BASE_CSS}\n  :root {{ --org-color: {org_color}; }}\n</style>\n'
+        f'<link rel="stylesheet" href="{"../" * depth}{_ASSETS_DIR}/style.css?v={_CSS_VERSION}">\n'
+        f'<style>:root {{ --org-color: {org_color}; }}</style>\n'
         f'</head>\n<body>\n'
         f'<nav class="site-nav">\n'
         f'  <a class="site-nav-logo" href="{"../" * depth}index.html">IDVTuber <em>Tracker</em></a>\n'
@@ -1724,7 +2147,141 @@ _ORG_JS = """
 })();
 </script>"""
 
+# Static chart setup for stream pages. Expects the per-page globals
+# ts / views / likes / comms / VIDEO_ID / orgColor to be declared first,
+# inside the same <script> element, and closes that element.
+_STREAM_JS = """
+// ── Theme-aware colours (read CSS variables at runtime) ─────────
+function getCSSVar(name) {
+  return getComputedStyle(document.documentElement).getPropertyValue(name).trim();
+}
+function chartColors() {
+  return {
+    grid: getCSSVar("--border") || "rgba(90,90,122,0.25)",
+    tick: getCSSVar("--muted")  || "#5a5a7a",
+  };
+}
 
+// ── Shared dataset defaults ──────────────────────────────────────
+const LINE = {
+  borderWidth: 2,
+  pointRadius: 0,          // no dots on the line
+  pointHoverRadius: 4,     // dot appears only on hover
+  pointHoverBorderWidth: 2,
+  fill: true,
+  tension: 0.4,            // smooth cubic bezier curve
+};
+
+// ── Base chart options ───────────────────────────────────────────
+function makeOpts(extraPlugins) {
+  const c = chartColors();
+  return {
+    responsive: true,
+    maintainAspectRatio: false,
+    interaction: { mode: "index", intersect: false },
+    plugins: {
+      legend: { labels: { color: c.tick, font: { family: "DM Mono", size: 11 }, boxWidth: 12 } },
+      zoom: {
+        pan: {
+          enabled: true,
+          mode: "x",
+        },
+        zoom: {
+          wheel:  { enabled: true },
+          pinch:  { enabled: true },
+          drag:   { enabled: true, modifierKey: "shift", backgroundColor: "rgba(255,255,255,0.05)", borderColor: "rgba(255,255,255,0.3)", borderWidth: 1 },
+          mode: "x",
+        },
+      },
+      ...extraPlugins,
+    },
+    scales: {
+      x: {
+        ticks: { color: c.tick, font: { family: "DM Mono", size: 10 }, maxTicksLimit: 10, maxRotation: 0 },
+        grid:  { color: c.grid },
+      },
+      y: {
+        ticks: { color: c.tick, font: { family: "DM Mono", size: 10 }, beginAtZero: true },
+        grid:  { color: c.grid },
+      },
+    },
+  };
+}
+
+// ── Chart registry ───────────────────────────────────────────────
+const CHARTS = {};
+
+// ── Viewer chart ─────────────────────────────────────────────────
+CHARTS.viewerChart = new Chart(document.getElementById("viewerChart"), {
+  type: "line",
+  data: {
+    labels: ts,
+    datasets: [{
+      label: "Concurrent Viewers",
+      data: views,
+      borderColor: orgColor,
+      backgroundColor: orgColor + "18",
+      ...LINE,
+    }],
+  },
+  options: makeOpts({}),
+});
+
+// ── Engagement chart ─────────────────────────────────────────────
+CHARTS.engagementChart = new Chart(document.getElementById("engagementChart"), {
+  type: "line",
+  data: {
+    labels: ts,
+    datasets: [
+      { label: "Likes",    data: likes, borderColor: "#ff4f6d", backgroundColor: "rgba(255,79,109,0.06)",  ...LINE },
+      { label: "Comments", data: comms, borderColor: "#4fc3f7", backgroundColor: "rgba(79,195,247,0.06)", ...LINE },
+    ],
+  },
+  options: makeOpts({}),
+});
+
+// ── Reset zoom ───────────────────────────────────────────────────
+function resetZoom(id) {
+  const c = CHARTS[id];
+  if (c) c.resetZoom();
+}
+
+// Attach double-click reset to both canvases
+document.getElementById("viewerChart").addEventListener("dblclick", function() { resetZoom("viewerChart"); });
+document.getElementById("engagementChart").addEventListener("dblclick", function() { resetZoom("engagementChart"); });
+
+// ── CSV download ─────────────────────────────────────────────────
+function downloadCSV(id) {
+  const chart = CHARTS[id];
+  if (!chart) return;
+  const datasets = chart.data.datasets;
+  const labels   = chart.data.labels;
+  // Header row: Timestamp + one column per dataset
+  const header = ["Timestamp", ...datasets.map(function(d) { return d.label; })];
+  // Data rows
+  const rows = labels.map(function(lbl, i) {
+    return [lbl, ...datasets.map(function(d) { return d.data[i] ?? ""; })]
+      .map(function(v) { return String(v).includes(",") ? '"' + v + '"' : v; })
+      .join(",");
+  });
+  const csv  = [header.join(","), ...rows].join("\\n");
+  const blob = new Blob([csv], { type: "text/csv" });
+  const url  = URL.createObjectURL(blob);
+  const a    = document.createElement("a");
+  a.href     = url;
+  a.download = VIDEO_ID + "_" + id + ".csv";
+  document.body.appendChild(a);
+  a.click();
+  document.body.removeChild(a);
+  URL.revokeObjectURL(url);
+}
+</script>
+"""
+
+
+# Only a handful of (depth, page_type) combinations exist, and the footer
+# carries the whole theme script, so every page shares one prebuilt copy.
+@lru_cache(maxsize=None)
 def _html_foot(depth: int, page_type: str = '') -> str:
     rel = "../" * depth
     extra_js = ''
@@ -1784,22 +2341,22 @@ def write_index(total_streams: int, total_channels: int, generated_at: str,
         return n_str, peak
 
     # ── build org cards ───────────────────────────────────────────────────────
-    org_cards = ""
+    org_cards: list[str] = []
     for org_slug, org in ORG_MAP.items():
         n_ch = len(org["channels"])
         n_streams, peak = _org_stats(org)
         peak_str = fmt(peak) if peak else "—"
-        org_cards += (
+        org_cards.append(
             f'\n    <a class="org-card" href="{org_slug}/index.html"'
             f' style="--org-color:{org["color"]}"'
-            f' data-name="{esc(org["label"])}"'
+            f' data-name="{_ORG_ESC[org_slug]["label"]}"'
             f' data-streams="{n_streams}" data-peak="{peak}">\n'
             f'      <div class="org-accent-bar"></div>\n'
             f'      <div class="org-card-body">\n'
             f'        <div class="org-card-top">\n'
-            f'          <div class="org-card-title">{esc(org["label"])}</div>\n'
+            f'          <div class="org-card-title">{_ORG_ESC[org_slug]["label"]}</div>\n'
             f'        </div>\n'
-            f'        <div class="org-card-desc">{esc(org["desc"])}</div>\n'
+            f'        <div class="org-card-desc">{_ORG_ESC[org_slug]["desc"]}</div>\n'
             f'        <div class="org-card-stats">\n'
             f'          <span class="ocs">&#128100; <strong>{n_ch}</strong></span>\n'
             f'          <span class="ocs">&#9654; <strong>{n_streams}</strong></span>\n'
@@ -1826,11 +2383,11 @@ def write_index(total_streams: int, total_channels: int, generated_at: str,
         f'    <span class="filter-chip">A&#8211;Z</span>\n'
         f'    <span class="filter-chip">Peak Viewers</span>\n'
         f'  </div>\n'
-        f'  <div class="orgs-grid">{org_cards}\n  </div>\n'
+        f'  <div class="orgs-grid">{"".join(org_cards)}\n  </div>\n'
     )
 
-    html = _html_head("Stream Analytics", 0) + body + _html_foot(0, 'index')
-    (OUTPUT_DIR / "index.html").write_text(html, encoding="utf-8")
+    _write_html(OUTPUT_DIR / "index.html",
+                (_html_head("Stream Analytics", 0), body, _html_foot(0, 'index')))
     log.info("Written: index.html")
 
 def write_org_page(org_slug: str, org: dict, stream_counts: dict,
@@ -1859,7 +2416,7 @@ def write_org_page(org_slug: str, org: dict, stream_counts: dict,
         total_subs += subscribers.get(ch_id, 0) or 0
 
     # ── channel cards ─────────────────────────────────────────────────────────
-    cards = ""
+    cards: list[str] = []
     for entry in org["channels"]:
         ch_name   = entry[0]
         ch_type   = entry[1]
@@ -1894,7 +2451,7 @@ def write_org_page(org_slug: str, org: dict, stream_counts: dict,
 
         role_lbl = "Org Channel" if ch_type == "org" else "Talent"
 
-        cards += (
+        cards.append(
             f'\n    <a class="channel-card" href="{ch_slug}/index.html"'
             f' data-name="{esc(ch_name)}" data-subs="{sub_count}"'
             f' data-streams="{n_str}" data-peak="{ch_peak}" data-likes="{ch_likes}">\n'
@@ -1922,8 +2479,8 @@ def write_org_page(org_slug: str, org: dict, stream_counts: dict,
         f'    <div class="org-hero-accent"></div>\n'
         f'    <div class="org-hero-body">\n'
         f'      <div class="org-hero-info">\n'
-        f'        <div class="org-hero-name">{esc(org["label"])}</div>\n'
-        f'        <div class="org-hero-desc">{esc(org["desc"])}</div>\n'
+        f'        <div class="org-hero-name">{_ORG_ESC[org_slug]["label"]}</div>\n'
+        f'        <div class="org-hero-desc">{_ORG_ESC[org_slug]["desc"]}</div>\n'
         f'        <div class="org-hero-stats">\n'
         f'          <div class="ohs"><div class="ohs-val">{len(org["channels"])}</div><div class="ohs-lbl">Channels</div></div>\n'
         f'          <div class="ohs"><div class="ohs-val">{total_org_streams}</div><div class="ohs-lbl">Streams</div></div>\n'
@@ -1942,11 +2499,11 @@ def write_org_page(org_slug: str, org: dict, stream_counts: dict,
         f'    <span class="sort-chip">Streams</span>\n'
         f'    <span class="sort-chip">A&#8211;Z</span>\n'
         f'  </div>\n'
-        f'  <div class="channels-grid">{cards}\n  </div>\n'
+        f'  <div class="channels-grid">{"".join(cards)}\n  </div>\n'
     )
 
-    html = _html_head(org["label"], 1, org["color"]) + body + _html_foot(1, 'org')
-    (org_dir / "index.html").write_text(html, encoding="utf-8")
+    _write_html(org_dir / "index.html",
+                (_html_head(org["label"], 1, org["color"]), body, _html_foot(1, 'org')))
     log.info("Written: %s/index.html", org_slug)
 
 
@@ -2011,7 +2568,11 @@ def write_channel_page(org_slug: str, org: dict, ch_name: str,
         except Exception:
             return None
 
-    dts = [d for d in (_stream_dt(s) for s in streams) if d]
+    # Convert each stream's first_seen to WIB exactly once; the tracking
+    # window, month grouping, records and both card renderers reuse it.
+    local_dts = {s["video_id"]: _stream_dt(s) for s in streams}
+
+    dts = [d for d in local_dts.values() if d]
     if dts:
         oldest  = min(dts)
         newest  = max(dts)
@@ -2047,13 +2608,13 @@ def write_channel_page(org_slug: str, org: dict, ch_name: str,
     def _rec_date(stream):
         if not stream:
             return "—"
-        dt = _stream_dt(stream)
+        dt = local_dts.get(stream["video_id"])
         return dt.strftime("%d %b %Y") if dt else "—"
 
     # ── group streams by month ─────────────────────────────────────────────────
     months: OrderedDict = OrderedDict()
     for stream in streams:
-        dt = _stream_dt(stream)
+        dt = local_dts[stream["video_id"]]
         month_key = dt.strftime("%B %Y") if dt else "Unknown"
         months.setdefault(month_key, []).append(stream)
 
@@ -2064,12 +2625,12 @@ def write_channel_page(org_slug: str, org: dict, ch_name: str,
         monthly_peaks[mk] = mp
     global_best_month = max(monthly_peaks, key=monthly_peaks.get) if monthly_peaks else None
 
-    monthly_rows = ""
+    monthly_rows: list[str] = []
     for mk, ms in months.items():
         is_best = mk == global_best_month
         tr_cls  = ' class="month-best-row"' if is_best else ""
         pk      = monthly_peaks.get(mk, 0)
-        monthly_rows += (
+        monthly_rows.append(
             f'      <tr{tr_cls}>\n'
             f'        <td><a class="month-a" href="#">{mk}</a></td>\n'
             f'        <td><span class="month-cnt">{len(ms)}</span></td>\n'
@@ -2085,7 +2646,7 @@ def write_channel_page(org_slug: str, org: dict, ch_name: str,
         v_slug = slugify(vid)
         status = stream.get("stream_status", "vod") or "vod"
         live   = status == "live"
-        dt     = _stream_dt(stream)
+        dt     = local_dts.get(vid)
         date_s = dt.strftime("%d %b %Y") if dt else "—"
         title  = esc((stream.get("video_title") or vid)[:70])
         thumb  = f"https://i.ytimg.com/vi/{vid}/mqdefault_live.jpg"
@@ -2109,9 +2670,7 @@ def write_channel_page(org_slug: str, org: dict, ch_name: str,
             f'    </a>\n'
         )
 
-    recent_cards_html = ""
-    for s in recent_8:
-        recent_cards_html += _rc_card(s)
+    recent_cards_html = "".join(_rc_card(s) for s in recent_8)
 
     recent_section_html = (
         f'  <div class="recent-streams-section">\n'
@@ -2129,9 +2688,9 @@ def write_channel_page(org_slug: str, org: dict, ch_name: str,
         status   = stream.get("stream_status", "vod") or "vod"
         live     = status == "live"
         badge    = '<div class="live-badge">Live</div>' if live else ""
-        dt       = _stream_dt(stream)
+        dt       = local_dts.get(vid)
         date_str = dt.strftime("%d %b %Y") if dt else "—"
-        time_str = fmt_dt(stream.get("first_seen"), time_only=True)
+        time_str = dt.strftime("%H:%M") if dt else "—"
         dur      = _dur_str(stream.get("first_seen"), stream.get("last_seen"))
         thumb    = f"https://i.ytimg.com/vi/{vid}/mqdefault_live.jpg"
         title    = esc((stream.get("video_title") or vid)[:90])
@@ -2164,11 +2723,11 @@ def write_channel_page(org_slug: str, org: dict, ch_name: str,
         )
 
     # Build one collapsible group per month; first month open by default
-    chron_groups = ""
+    chron_groups: list[str] = []
     for i, (mk, ms) in enumerate(months.items()):
         open_cls = " is-open" if i == 0 else ""
         rows_html = "".join(_row_item(s) for s in ms)
-        chron_groups += (
+        chron_groups.append(
             f'  <div class="month-group{open_cls}">\n'
             f'    <button class="month-toggle" aria-expanded="{"true" if i == 0 else "false"}">\n'
             f'      <span class="month-toggle-left">{mk}</span>\n'
@@ -2184,7 +2743,7 @@ def write_channel_page(org_slug: str, org: dict, ch_name: str,
         )
 
     if not months:
-        chron_groups = '  <p class="empty" style="padding:1.25rem;">No streams recorded yet.</p>\n'
+        chron_groups = ['  <p class="empty" style="padding:1.25rem;">No streams recorded yet.</p>\n']
 
     chron_js = (
         '<script>\n'
@@ -2203,7 +2762,7 @@ def write_channel_page(org_slug: str, org: dict, ch_name: str,
     stream_list_html = (
         f'    <div class="stream-list-panel">\n'
         f'      <div class="panel-hdr">All streams — by month</div>\n'
-        + chron_groups
+        + "".join(chron_groups)
         + f'    </div>\n'
     )
 
@@ -2226,7 +2785,7 @@ def write_channel_page(org_slug: str, org: dict, ch_name: str,
         f'      <div class="hero-info">\n'
         f'        <div class="hero-org-badge">\n'
         f'          <div class="hero-org-dot"></div>\n'
-        f'          {esc(org["label"])}\n'
+        f'          {_ORG_ESC[org_slug]["label"]}\n'
         f'        </div>\n'
         f'        <div class="hero-name">{esc(ch_name)}</div>\n'
         f'        <div class="hero-meta-row">\n'
@@ -2263,7 +2822,7 @@ def write_channel_page(org_slug: str, org: dict, ch_name: str,
         f'            <th>Month</th><th>Streams</th><th>Peak CCV</th>\n'
         f'          </tr></thead>\n'
         f'          <tbody>\n'
-        + monthly_rows
+        + "".join(monthly_rows)
         + f'          </tbody>\n'
         f'        </table>\n'
         f'      </div>\n'
@@ -2296,13 +2855,87 @@ def write_channel_page(org_slug: str, org: dict, ch_name: str,
         + chron_js
     )
 
-    html = _html_head(ch_name, 2, org["color"]) + body + _html_foot(2)
-    (ch_dir / "index.html").write_text(html, encoding="utf-8")
+    _write_html(ch_dir / "index.html",
+                (_html_head(ch_name, 2, org["color"]), body, _html_foot(2)))
     log.info("  Written: %s/%s/index.html", org_slug, ch_slug)
 
 
+_CHART_SCRIPTS = (
+    '<script src="https://cdn.jsdelivr.net/npm/chart.js@4.4.0/dist/chart.umd.min.js"></script>\n'
+    '<script src="https://cdnjs.cloudflare.com/ajax/libs/hammer.js/2.0.8/hammer.min.js"></script>\n'
+    '<script src="https://cdnjs.cloudflare.com/ajax/libs/chartjs-plugin-zoom/2.0.1/chartjs-plugin-zoom.min.js"></script>'
+)
+
+
+def _lttb_indices(values: list, threshold: int) -> list[int]:
+    """
+    Largest-Triangle-Three-Buckets (Steinarsson, 2013): pick *threshold*
+    indices from *values* that preserve the visual shape of the line —
+    first and last samples are always kept, and each bucket keeps the point
+    forming the largest triangle with its neighbours, so spikes survive.
+    Samples are treated as evenly spaced (the tracker polls on a fixed cycle).
+    """
+    n = len(values)
+    if threshold >= n or threshold < 3:
+        return list(range(n))
+
+    every  = (n - 2) / (threshold - 2)
+    picked = [0]
+    add    = picked.append
+    _abs   = abs   # local: looked up once per sample in the inner loop
+    a      = 0
+    for i in range(threshold - 2):
+        # average point of the next bucket
+        avg_start = int((i + 1) * every) + 1
+        avg_end   = min(int((i + 2) * every) + 1, n)
+        avg_x     = (avg_start + avg_end - 1) / 2
+        avg_y     = sum(values[avg_start:avg_end]) / (avg_end - avg_start)
+
+        # point in the current bucket with the largest triangle area;
+        # the terms that only depend on the bucket are hoisted out
+        ay        = values[a]
+        dx        = a - avg_x
+        dy        = avg_y - ay
+        best      = rng_start = int(i * every) + 1
+        best_area = -1.0
+        for j in range(rng_start, int((i + 1) * every) + 1):
+            area = _abs(dx * (values[j] - ay) - (a - j) * dy)
+            if area > best_area:
+                best_area, best = area, j
+        add(best)
+        a = best
+    add(n - 1)
+    return picked
+
+
+def _downsample_series(series: dict, threshold: int) -> dict:
+    """
+    Bound the chart payload: choose LTTB indices on the viewer curve and take
+    the same samples from every array so labels and datasets stay aligned.
+    """
+    if len(series["viewers"]) <= threshold:
+        return series
+    idx = _lttb_indices(series["viewers"], threshold)
+    return {key: [vals[i] for i in idx] for key, vals in series.items()}
+
+
+def _fmt_duration(first, last) -> str:
+    """Return full duration string e.g. '2h 07m 09s' for the stream KPI grid."""
+    if not first or not last:
+        return "—"
+    try:
+        delta = last - first
+        total = int(delta.total_seconds())
+        h, rem = divmod(total, 3600)
+        m, s   = divmod(rem, 60)
+        return f"{h}h {m:02d}m {s:02d}s" if h else f"{m}m {s:02d}s"
+    except Exception:
+        return "—"
+
+
 def write_stream_page(org_slug: str, org: dict, ch_name: str,
-                      stream: dict, timeseries: list[dict]) -> None:
+                      stream: dict, series: dict,
+                      generated_at: str | None = None) -> None:
     vid     = stream["video_id"]
     v_slug  = slugify(vid)
     ch_slug = slugify(ch_name)
@@ -2317,10 +2950,14 @@ def write_stream_page(org_slug: str, org: dict, ch_name: str,
     else:
         s_cls, s_lbl = "status-vod",      "VOD"
 
-    labels   = [fmt_dt(r["collected_at"], time_only=True) for r in timeseries]
-    viewers  = [int(r["concurrent_viewers"] or 0) for r in timeseries]
-    likes    = [int(r["like_count"]         or 0) for r in timeseries]
-    comments = [int(r["comment_count"]      or 0) for r in timeseries]
+    if generated_at is None:
+        generated_at = _now_local().strftime("%Y-%m-%d %H:%M WIB")
+
+    series   = _downsample_series(series, CHART_MAX_POINTS)
+    labels   = series["labels"]
+    viewers  = series["viewers"]
+    likes    = series["likes"]
+    comments = series["comments"]
 
     title_text  = stream["video_title"] or vid
     short_title = (title_text[:40] + "…") if len(title_text) > 40 else title_text
@@ -2333,30 +2970,12 @@ def write_stream_page(org_slug: str, org: dict, ch_name: str,
         (short_title,  ""),
     ])
 
-    chart_script = (
-        '<script src="https://cdn.jsdelivr.net/npm/chart.js@4.4.0/dist/chart.umd.min.js"></script>\n'
-        '<script src="https://cdnjs.cloudflare.com/ajax/libs/hammer.js/2.0.8/hammer.min.js"></script>\n'
-        '<script src="https://cdnjs.cloudflare.com/ajax/libs/chartjs-plugin-zoom/2.0.1/chartjs-plugin-zoom.min.js"></script>'
-    )
-
-    def _fmt_duration(first, last) -> str:
-        if not first or not last:
-            return "—"
-        try:
-            delta = last - first
-            total = int(delta.total_seconds())
-            h, rem = divmod(total, 3600)
-            m, s   = divmod(rem, 60)
-            return f"{h}h {m:02d}m {s:02d}s" if h else f"{m}m {s:02d}s"
-        except Exception:
-            return "—"
-
     duration_str = _fmt_duration(stream["first_seen"], stream["last_seen"])
 
     body = (
         bc
         + f'  <header>\n'
-        f'    <p class="eyebrow">{esc(org["label"])} &nbsp;&#183;&nbsp; {esc(ch_name)}</p>\n'
+        f'    <p class="eyebrow">{_ORG_ESC[org_slug]["label"]} &nbsp;&#183;&nbsp; {esc(ch_name)}</p>\n'
         f'    <span class="stream-status {s_cls}" style="display:inline-block;margin-bottom:0.75rem;">{s_lbl}</span>\n'
         f'    <h1>{esc(title_text)}</h1>\n'
         f'    <p class="page-meta">Video ID: {esc(vid)}</p>\n'
@@ -2406,146 +3025,21 @@ def write_stream_page(org_slug: str, org: dict, ch_name: str,
         f'    <div class="chart-wrap"><canvas id="engagementChart"></canvas></div>\n'
         f'    <p class="chart-hint">Scroll to zoom &nbsp;&#183;&nbsp; Shift+drag to select range &nbsp;&#183;&nbsp; Drag to pan &nbsp;&#183;&nbsp; Double-click to reset</p>\n'
         f'  </div>\n\n'
-        f'  <p class="generated">Generated {_now_local().strftime("%Y-%m-%d %H:%M WIB")}'
+        f'  <p class="generated">Generated {generated_at}'
         f' &nbsp;&#183;&nbsp; yt-livestream-tracker</p>\n\n'
         f'<script>\n'
         f'// ── Data ────────────────────────────────────────────────────────\n'
-        f'const ts    = {json.dumps(labels)};\n'
-        f'const views = {json.dumps(viewers)};\n'
-        f'const likes = {json.dumps(likes)};\n'
-        f'const comms = {json.dumps(comments)};\n'
-        f'const VIDEO_ID = {json.dumps(vid)};\n'
+        f'const ts    = {_dumps(labels)};\n'
+        f'const views = {_dumps(viewers)};\n'
+        f'const likes = {_dumps(likes)};\n'
+        f'const comms = {_dumps(comments)};\n'
+        f'const VIDEO_ID = {_dumps(vid)};\n'
         f"const orgColor = '{org_color}';\n"
-        f'\n'
-        f'// ── Theme-aware colours (read CSS variables at runtime) ─────────\n'
-        f'function getCSSVar(name) {{\n'
-        f'  return getComputedStyle(document.documentElement).getPropertyValue(name).trim();\n'
-        f'}}\n'
-        f'function chartColors() {{\n'
-        f'  return {{\n'
-        f'    grid: getCSSVar("--border") || "rgba(90,90,122,0.25)",\n'
-        f'    tick: getCSSVar("--muted")  || "#5a5a7a",\n'
-        f'  }};\n'
-        f'}}\n'
-        f'\n'
-        f'// ── Shared dataset defaults ──────────────────────────────────────\n'
-        f'const LINE = {{\n'
-        f'  borderWidth: 2,\n'
-        f'  pointRadius: 0,          // no dots on the line\n'
-        f'  pointHoverRadius: 4,     // dot appears only on hover\n'
-        f'  pointHoverBorderWidth: 2,\n'
-        f'  fill: true,\n'
-        f'  tension: 0.4,            // smooth cubic bezier curve\n'
-        f'}};\n'
-        f'\n'
-        f'// ── Base chart options ───────────────────────────────────────────\n'
-        f'function makeOpts(extraPlugins) {{\n'
-        f'  const c = chartColors();\n'
-        f'  return {{\n'
-        f'    responsive: true,\n'
-        f'    maintainAspectRatio: false,\n'
-        f'    interaction: {{ mode: "index", intersect: false }},\n'
-        f'    plugins: {{\n'
-        f'      legend: {{ labels: {{ color: c.tick, font: {{ family: "DM Mono", size: 11 }}, boxWidth: 12 }} }},\n'
-        f'      zoom: {{\n'
-        f'        pan: {{\n'
-        f'          enabled: true,\n'
-        f'          mode: "x",\n'
-        f'        }},\n'
-        f'        zoom: {{\n'
-        f'          wheel:  {{ enabled: true }},\n'
-        f'          pinch:  {{ enabled: true }},\n'
-        f'          drag:   {{ enabled: true, modifierKey: "shift", backgroundColor: "rgba(255,255,255,0.05)", borderColor: "rgba(255,255,255,0.3)", borderWidth: 1 }},\n'
-        f'          mode: "x",\n'
-        f'        }},\n'
-        f'      }},\n'
-        f'      ...extraPlugins,\n'
-        f'    }},\n'
-        f'    scales: {{\n'
-        f'      x: {{\n'
-        f'        ticks: {{ color: c.tick, font: {{ family: "DM Mono", size: 10 }}, maxTicksLimit: 10, maxRotation: 0 }},\n'
-        f'        grid:  {{ color: c.grid }},\n'
-        f'      }},\n'
-        f'      y: {{\n'
-        f'        ticks: {{ color: c.tick, font: {{ family: "DM Mono", size: 10 }}, beginAtZero: true }},\n'
-        f'        grid:  {{ color: c.grid }},\n'
-        f'      }},\n'
-        f'    }},\n'
-        f'  }};\n'
-        f'}}\n'
-        f'\n'
-        f'// ── Chart registry ───────────────────────────────────────────────\n'
-        f'const CHARTS = {{}};\n'
-        f'\n'
-        f'// ── Viewer chart ─────────────────────────────────────────────────\n'
-        f'CHARTS.viewerChart = new Chart(document.getElementById("viewerChart"), {{\n'
-        f'  type: "line",\n'
-        f'  data: {{\n'
-        f'    labels: ts,\n'
-        f'    datasets: [{{\n'
-        f'      label: "Concurrent Viewers",\n'
-        f'      data: views,\n'
-        f'      borderColor: orgColor,\n'
-        f'      backgroundColor: orgColor + "18",\n'
-        f'      ...LINE,\n'
-        f'    }}],\n'
-        f'  }},\n'
-        f'  options: makeOpts({{}}),\n'
-        f'}});\n'
-        f'\n'
-        f'// ── Engagement chart ─────────────────────────────────────────────\n'
-        f'CHARTS.engagementChart = new Chart(document.getElementById("engagementChart"), {{\n'
-        f'  type: "line",\n'
-        f'  data: {{\n'
-        f'    labels: ts,\n'
-        f'    datasets: [\n'
-        f'      {{ label: "Likes",    data: likes, borderColor: "#ff4f6d", backgroundColor: "rgba(255,79,109,0.06)",  ...LINE }},\n'
-        f'      {{ label: "Comments", data: comms, borderColor: "#4fc3f7", backgroundColor: "rgba(79,195,247,0.06)", ...LINE }},\n'
-        f'    ],\n'
-        f'  }},\n'
-        f'  options: makeOpts({{}}),\n'
-        f'}});\n'
-        f'\n'
-        f'// ── Reset zoom ───────────────────────────────────────────────────\n'
-        f'function resetZoom(id) {{\n'
-        f'  const c = CHARTS[id];\n'
-        f'  if (c) c.resetZoom();\n'
-        f'}}\n'
-        f'\n'
-        f'// Attach double-click reset to both canvases\n'
-        f'document.getElementById("viewerChart").addEventListener("dblclick", function() {{ resetZoom("viewerChart"); }});\n'
-        f'document.getElementById("engagementChart").addEventListener("dblclick", function() {{ resetZoom("engagementChart"); }});\n'
-        f'\n'
-        f'// ── CSV download ─────────────────────────────────────────────────\n'
-        f'function downloadCSV(id) {{\n'
-        f'  const chart = CHARTS[id];\n'
-        f'  if (!chart) return;\n'
-        f'  const datasets = chart.data.datasets;\n'
-        f'  const labels   = chart.data.labels;\n'
-        f'  // Header row: Timestamp + one column per dataset\n'
-        f'  const header = ["Timestamp", ...datasets.map(function(d) {{ return d.label; }})];\n'
-        f'  // Data rows\n'
-        f'  const rows = labels.map(function(lbl, i) {{\n'
-        f'    return [lbl, ...datasets.map(function(d) {{ return d.data[i] ?? ""; }})]\n'
-        f'      .map(function(v) {{ return String(v).includes(",") ? \'"\' + v + \'"\' : v; }})\n'
-        f'      .join(",");\n'
-        f'  }});\n'
-        f'  const csv  = [header.join(","), ...rows].join("\\n");\n'
-        f'  const blob = new Blob([csv], {{ type: "text/csv" }});\n'
-        f'  const url  = URL.createObjectURL(blob);\n'
-        f'  const a    = document.createElement("a");\n'
-        f'  a.href     = url;\n'
-        f'  a.download = VIDEO_ID + "_" + id + ".csv";\n'
-        f'  document.body.appendChild(a);\n'
-        f'  a.click();\n'
-        f'  document.body.removeChild(a);\n'
-        f'  URL.revokeObjectURL(url);\n'
-        f'}}\n'
-        f'</script>\n'
+        + _STREAM_JS
     )
 
-    html = _html_head(title_text, 2, org_color, chart_script) + body + _html_foot(2)
-    (ch_dir / f"{v_slug}.html").write_text(html, encoding="utf-8")
+    _write_html(ch_dir / f"{v_slug}.html",
+                (_html_head(title_text, 2, org_color, _CHART_SCRIPTS), body, _html_foot(2)))
     log.info("    Written: %s/%s/%s.html", org_slug, ch_slug, v_slug)
 
 
@@ -2553,26 +3047,29 @@ def write_stream_page(org_slug: str, org: dict, ch_name: str,
 # PARTIAL BUILD ENGINE
 # ══════════════════════════════════════════════════════════════════════════════
 
-def _enrich_stream(stream: dict, conn, table: str, hist) -> tuple[dict, list, list]:
+def _enrich_stream(stream: dict, series: dict | None, hist) -> tuple[dict, dict]:
     """
-    Fetch timeseries and compute avg_viewers for a stream.
-    Returns (enriched_stream, timeseries).
+    Attach the chart series and compute avg_viewers for a stream.
+    Returns (enriched_stream, series).
+    *series* is prefetched per channel — iter_timeseries_for_channel() for
+    live-DB streams, iter_archived_timeseries() for archived ones; archived
+    streams passed without one are read from history.db individually.
     all_rows is no longer fetched — the raw data table was removed from the stream page.
     """
     is_archived = stream.get("_source") == "history"
 
     if is_archived:
-        ts = get_archived_timeseries(hist, stream["video_id"])
-        if stream.get("avg_viewers") is None:
-            viewer_vals = [int(r["concurrent_viewers"]) for r in ts if r["concurrent_viewers"]]
-            stream["avg_viewers"] = round(sum(viewer_vals) / len(viewer_vals)) if viewer_vals else None
+        if series is None:
+            series = _series_from_rows(get_archived_timeseries(hist, stream["video_id"]))
     else:
-        ts = get_stream_timeseries(conn, table, stream["video_id"])
-        viewer_vals = [int(r["concurrent_viewers"]) for r in ts if r["concurrent_viewers"]]
+        series = series or _series_from_rows([])
         stream = dict(stream)
+
+    if not is_archived or stream.get("avg_viewers") is None:
+        viewer_vals = [v for v in series["viewers"] if v]
         stream["avg_viewers"] = round(sum(viewer_vals) / len(viewer_vals)) if viewer_vals else None
 
-    return stream, ts
+    return stream, series
 
 
 def build_dashboard() -> None:
@@ -2580,19 +3077,35 @@ def build_dashboard() -> None:
         print("ERROR: AIVEN_DATABASE_URL environment variable is not set.")
         raise SystemExit(1)
 
-    conn = get_conn()
+    db_pool = _get_pool()
+    conn = db_pool.getconn()
+    # The main connection only runs standalone catalogue/summary SELECTs and
+    # is then held idle for the whole render phase.  Autocommit keeps it from
+    # sitting "idle in transaction" (pinning a snapshot and holding back
+    # vacuum on Aiven) and skips the implicit BEGIN per query.  Channel tasks
+    # keep regular transactions: their named cursors require one.
+    conn.autocommit = True
     hist = get_history_conn()
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    write_assets()
 
     # ── static legal pages ────────────────────────────────────────────────────
+    # copy2 preserves mtime, so a destination whose size and mtime match the
+    # source is the copy made by an earlier run and can be left alone.
     for legal_file in ["privacy.html", "terms.html"]:
         src = Path(legal_file)
         dst = OUTPUT_DIR / legal_file
-        if src.exists():
-            shutil.copy2(src, dst)
-            log.info("Copied %s to %s/", legal_file, OUTPUT_DIR)
-        else:
+        if not src.exists():
             log.warning("Legal file not found: %s — skipping", legal_file)
+            continue
+        src_st = src.stat()
+        if dst.exists():
+            dst_st = dst.stat()
+            if dst_st.st_size == src_st.st_size and dst_st.st_mtime >= src_st.st_mtime:
+                log.info("%s already up to date in %s/", legal_file, OUTPUT_DIR)
+                continue
+        shutil.copy2(src, dst)
+        log.info("Copied %s to %s/", legal_file, OUTPUT_DIR)
 
     # ── channel ID / logo maps ────────────────────────────────────────────────
     db_channels = get_channel_rows(conn)
@@ -2616,6 +3129,7 @@ def build_dashboard() -> None:
     # ── bulk-load schema cache (single query for all tables) ─────────────────
     all_table_names = [ch["table_name"] for ch in db_channels]
     _load_schema_cache(conn, all_table_names)
+    ensure_indexes(conn, all_table_names)
 
     # ── load manifest ─────────────────────────────────────────────────────────
     manifest = load_manifest()
@@ -2700,16 +3214,17 @@ def build_dashboard() -> None:
     dirty_channels:  set[str] = set()
     dirty_orgs:      set[str] = set()
 
+    # A matching fingerprint only counts if the page is still on disk: the
+    # manifest can outlive the HTML (fresh checkout, wiped output dir).
     for ch_name, streams in all_streams_by_channel.items():
+        org_result = _CH_TO_ORG.get(ch_name)
+        ch_dir     = OUTPUT_DIR / org_result[0] / slugify(ch_name) if org_result else None
         for stream in streams:
-            vid         = stream["video_id"]
-            in_manifest = vid in manifest
-            was_live    = manifest.get(vid, {}).get("status") == "live"
-
-            if not in_manifest or was_live:
+            vid = stream["video_id"]
+            if (_manifest_is_stale(manifest.get(vid), stream)
+                    or (ch_dir and not (ch_dir / f"{slugify(vid)}.html").exists())):
                 dirty_video_ids.add(vid)
                 dirty_channels.add(ch_name)
-                org_result = _CH_TO_ORG.get(ch_name)
                 if org_result:
                     dirty_orgs.add(org_result[0])
 
@@ -2733,43 +3248,129 @@ def build_dashboard() -> None:
                 if stream["video_id"] in dirty_video_ids:
                     dirty_work.append((org_slug, org, ch_name, table, stream))
 
-    # Capture a single timestamp for all manifest entries written this run
-    run_ts = _now_local().strftime("%Y-%m-%d %H:%M WIB")
-
-    # ── generate dirty stream pages (parallel) ────────────────────────────────
-    # Both psycopg2 and sqlite3 connections are NOT thread-safe — they must not
-    # be shared across threads.  Each worker opens its own short-lived
-    # connections and closes them before returning.
-    def _write_one_stream(args):
-        org_slug, org, ch_name, table, stream = args
-        t_conn = get_conn()
-        t_hist = get_history_conn()
-        try:
-            enriched, ts = _enrich_stream(stream, t_conn, table, t_hist)
-            write_stream_page(org_slug, org, ch_name, enriched, ts)
-            return enriched["video_id"], {
+    # Capture a single timestamp for every page and manifest entry written
+    # this run, so pages from one build all show the same "Generated" time.
+    generated_at = _now_local().strftime("%Y-%m-%d %H:%M WIB")
+
+    # ── group dirty streams per channel ───────────────────────────────────────
+    # Each item: (org_slug, org, ch_name, table, [stream, ...]) in ORG_MAP order
+    channel_work: dict[str, tuple] = {}
+    for org_slug, org, ch_name, table, stream in dirty_work:
+        channel_work.setdefault(ch_name, (org_slug, org, ch_name, table, []))[4].append(stream)
+
+    # ── optional process pool for CPU-bound rendering ────────────────────────
+    # "spawn" rather than fork: the parent already runs DB/worker threads, and
+    # forking a threaded process can deadlock on locks held at fork time.
+    # Workers only render + write; all DB access stays in this process.
+    n_procs      = os.cpu_count() or 1
+    render_procs = None
+    if len(dirty_work) >= PROCESS_RENDER_MIN and n_procs > 1:
+        render_procs = ProcessPoolExecutor(
+            max_workers=n_procs, mp_context=multiprocessing.get_context("spawn")
+        )
+        log.info("Rendering %d stream page(s) across %d processes.", len(dirty_work), n_procs)
+
+    # ── generate dirty stream pages (parallel, one task per channel) ──────────
+    # Neither psycopg2 nor sqlite3 connections are thread-safe.  Each task
+    # borrows its own pooled Postgres connection and streams the chart series
+    # for all its live streams from ONE query, rendering each page as its
+    # series arrives.  Archived streams read history.db through one
+    # read-only connection per worker thread, opened the first time that
+    # thread needs it and reused for every later channel it picks up.
+    hist_tls   = threading.local()
+    hist_conns: list[sqlite3.Connection] = []
+
+    def _thread_hist():
+        if not hasattr(hist_tls, "conn"):
+            hist_tls.conn = get_history_conn()
+            if hist_tls.conn:
+                hist_conns.append(hist_tls.conn)
+        return hist_tls.conn
+
+    def _process_channel(work) -> list[tuple[str, dict]]:
+        org_slug, org, ch_name, table, streams = work
+        live    = {s["video_id"]: s for s in streams if s.get("_source") != "history"}
+        pending = [s for s in streams if s.get("_source") == "history"]
+        entries = []
+        in_flight: list[tuple] = []   # (future, enriched) when rendering in processes
+
+        def _record(enriched) -> None:
+            entries.append((enriched["video_id"], {
                 "org_slug":     org_slug,
                 "ch_slug":      slugify(ch_name),
                 "ch_name":      ch_name,
-                "status":       enriched.get("stream_status") or "vod",
-                "generated_at": run_ts,
-            }
-        finally:
-            t_conn.close()
+                "generated_at": generated_at,
+                **_stream_fingerprint(enriched),
+            }))
+
+        def _render(stream, series, hist=None) -> None:
+            try:
+                enriched, series = _enrich_stream(stream, series, hist)
+                if render_procs:
+                    # downsample before pickling so only the chart payload crosses over
+                    series = _downsample_series(series, CHART_MAX_POINTS)
+                    in_flight.append((render_procs.submit(
+                        write_stream_page, org_slug, org, ch_name, enriched, series, generated_at
+                    ), enriched))
+                    return
+                write_stream_page(org_slug, org, ch_name, enriched, series, generated_at)
+            except Exception as exc:
+                log.error("Stream page generation failed for %s: %s",
+                          stream["video_id"], exc)
+                return
+            _record(enriched)
+
+        if live:
+            with pooled_conn() as t_conn:
+                for vid, series in iter_timeseries_for_channel(t_conn, table, list(live)):
+                    _render(live.pop(vid), series)
+            # live-DB streams with no timeseries rows still get a page
+            for stream in live.values():
+                _render(stream, None)
+
+        if pending:
+            t_hist = _thread_hist()
             if t_hist:
-                t_hist.close()
-
-    # _enrich_stream issues DB queries; use threads so the GIL releases during
-    # network I/O and multiple timeseries fetches overlap.
-    max_workers = min(8, max(1, len(dirty_work)))
-    with ThreadPoolExecutor(max_workers=max_workers) as pool:
-        futures = [pool.submit(_write_one_stream, item) for item in dirty_work]
-        for fut in as_completed(futures):
+                by_vid = {s["video_id"]: s for s in pending}
+                for vid, series in iter_archived_timeseries(t_hist, list(by_vid)):
+                    stream = by_vid.pop(vid, None)
+                    if stream:
+                        _render(stream, series)
+                # archived streams without timeseries rows still get a page
+                for stream in by_vid.values():
+                    _render(stream, _series_from_rows([]))
+            else:
+                for stream in pending:
+                    _render(stream, None, t_hist)
+
+        for fut, enriched in in_flight:
             try:
-                vid, entry = fut.result()
-                manifest[vid] = entry
+                fut.result()
             except Exception as exc:
-                log.error("Stream page generation failed: %s", exc)
+                log.error("Stream page generation failed for %s: %s",
+                          enriched["video_id"], exc)
+                continue
+            _record(enriched)
+        return entries
+
+    # Channel tasks are dominated by DB round-trips (psycopg2 releases the GIL
+    # while waiting), so threads overlap them.  One pool slot stays reserved
+    # for the main-thread connection held by build_dashboard.
+    max_workers = min(DB_POOL_MAX - 1, max(1, len(channel_work)))
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [pool.submit(_process_channel, w) for w in channel_work.values()]
+            for fut in as_completed(futures):
+                try:
+                    for vid, entry in fut.result():
+                        manifest[vid] = entry
+                except Exception as exc:
+                    log.error("Stream page generation failed: %s", exc)
+    finally:
+        if render_procs:
+            render_procs.shutdown()
+        for h in hist_conns:
+            h.close()
 
     # ── regenerate channel pages (parallel) ──────────────────────────────────
     channel_write_args = []
@@ -2817,14 +3418,15 @@ def build_dashboard() -> None:
     log.info("Org pages written: %d", len(ORG_MAP))
 
     # ── always regenerate index ───────────────────────────────────────────────
-    generated_at = _now_local().strftime("%Y-%m-%d %H:%M WIB")
     write_index(total_streams, total_channels, generated_at,
                 stream_counts, all_streams_by_channel)
 
     # ── persist manifest ──────────────────────────────────────────────────────
     save_manifest(manifest)
 
-    conn.close()
+    conn.autocommit = False
+    db_pool.putconn(conn)
+    close_pool()
     if hist:
         hist.close()
 
@@ -10,6 +10,7 @@ sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='repla
 sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
 import os
+import re
 import time
 import csv
 import json
@@ -17,11 +18,14 @@ import logging
 import signal
 import sys
 import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Optional
 
 import psycopg2
 import psycopg2.extras
+import psycopg2.pool
 import requests
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
@@ -63,6 +67,10 @@ ANALYTICS_MISS_TOLERANCE   = int(os.environ.get("ANALYTICS_MISS_TOLERANCE", "3")
 # Streams outside this window are left to the normal activities.list scan.
 # Default: 600s (10 minutes). Lower = tighter detection, more API calls.
 UPCOMING_POLL_WINDOW_SEC   = int(os.environ.get("UPCOMING_POLL_WINDOW_SEC", "600"))
+# Worker threads for the activities.list channel scan. Each channel costs two
+# sequential HTTPS round-trips, so scanning ~200 channels one after another
+# took up to two minutes; the calls are pure network wait and overlap freely.
+SCAN_WORKERS               = int(os.environ.get("SCAN_WORKERS", "8"))
 
 
 # ── API key rotation ───────────────────────────────────────────────────────────
@@ -183,6 +191,30 @@ youtube = _build_client(_current_key())
 log.info("YouTube API client initialised with %d key(s) (%d exhausted today).",
          len(YOUTUBE_API_KEYS), len(_exhausted))
 
+# ── per-thread clients for the concurrent channel scan ────────────────────────
+# googleapiclient clients wrap a single httplib2.Http, which is not
+# thread-safe, so every scan worker keeps its own client and rebuilds it only
+# when the active key changes. _key_lock serialises quota rotation so two
+# workers hitting 403 on the same key do not each burn a further key.
+_key_lock = threading.Lock()
+_scan_tls = threading.local()
+
+
+def _scan_client(key: str):
+    if getattr(_scan_tls, "key", None) != key:
+        _scan_tls.client = _build_client(key)
+        _scan_tls.key    = key
+    return _scan_tls.client
+
+
+def _rotate_after_403(failed_key: str) -> bool:
+    """Mark failed_key exhausted unless another worker already rotated past it.
+    Returns True if a fresh key is available to retry with."""
+    with _key_lock:
+        if _current_key() != failed_key:
+            return True
+        return _mark_exhausted()
+
 # ── timezone helpers ──────────────────────────────────────────────────────────
 from datetime import timedelta
 from zoneinfo import ZoneInfo
@@ -203,29 +235,96 @@ def _now_pacific() -> datetime:
     return datetime.now(_PACIFIC_TZ)
 
 # ── in-memory history for charts ───────────────────────────────────────────────
-history: dict[str, list] = {}   # video_id -> list of (ts, viewers, likes, comments)
+# video_id -> last MAX_HISTORY_POINTS (ts, viewers, likes, comments); the
+# bounded deque evicts the oldest point on append instead of list.pop(0).
+history: dict[str, deque] = {}
 
 
 # ══════════════════════════════════════════════════════════════════════════════
 # DATABASE
 # ══════════════════════════════════════════════════════════════════════════════
 
+# One small pool for the whole tracker lifetime. Previously every DB touch
+# (each cycle's batch flush, every init_channel_table() call) opened a fresh
+# connection and paid the TCP + TLS + auth handshake again; the pool keeps a
+# connection warm between 30s cycles instead. libpq keepalives stop Aiven from
+# silently dropping the socket while it sits idle between cycles.
+_CONN_KWARGS = dict(
+    sslmode="require",
+    connect_timeout=10,
+    options="-c search_path=public -c statement_timeout=30000",
+    keepalives=1,
+    keepalives_idle=30,
+    keepalives_interval=10,
+    keepalives_count=3,
+)
+DB_POOL_MAX = 4   # main loop only; the dashboard-worker thread never touches the DB
+
+_pool: Optional[psycopg2.pool.ThreadedConnectionPool] = None
+_pool_lock = threading.Lock()
+
+
 def _new_conn() -> Optional[psycopg2.extensions.connection]:
-    """Open and return a fresh DB connection, or None on failure."""
+    """Borrow a DB connection from the pool, or None on failure.
+
+    Every connection obtained here must be handed back with _release_conn().
+    The pool is created lazily so a DB outage at startup is retried on the
+    next call instead of being fatal.
+    """
+    global _pool
     if not AIVEN_DATABASE_URL:
         return None
     try:
-        return psycopg2.connect(
-            AIVEN_DATABASE_URL,
-            sslmode="require",
-            connect_timeout=10,
-            options="-c search_path=public -c statement_timeout=30000",
-        )
+        with _pool_lock:
+            if _pool is None:
+                _pool = psycopg2.pool.ThreadedConnectionPool(
+                    1, DB_POOL_MAX, AIVEN_DATABASE_URL, **_CONN_KWARGS
+                )
+            pool = _pool
+        conn = pool.getconn()
+        if conn.closed:
+            # Dropped since it was last returned — replace it with a new one.
+            pool.putconn(conn, close=True)
+            conn = pool.getconn()
+        return conn
     except Exception as e:
         log.error("DB connection failed: %s", e)
         return None
 
 
+def _release_conn(conn: psycopg2.extensions.connection, discard: bool = False) -> None:
+    """Return a connection from _new_conn() to the pool.
+
+    Broken connections (or any passed with discard=True) are closed rather
+    than reused, and autocommit
+    (set by the DDL helpers) is switched back off so it never leaks into the
+    next borrower's batched INSERT transaction. The pool itself rolls back
+    any transaction left open.
+    """
+    try:
+        if not conn.closed and conn.autocommit:
+            conn.autocommit = False
+    except Exception:
+        pass
+    pool = _pool
+    try:
+        if pool is None:
+            conn.close()
+        else:
+            pool.putconn(conn, close=discard or bool(conn.closed))
+    except Exception:
+        pass
+
+
+def close_pool() -> None:
+    """Close every pooled connection. Called once when run() exits."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.closeall()
+            _pool = None
+
+
 def ping_db() -> bool:
     """Lightweight connectivity check. Returns True if DB is reachable."""
     conn = _new_conn()
@@ -239,19 +338,19 @@ def ping_db() -> bool:
         log.warning("DB ping failed: %s", e)
         return False
     finally:
-        try:
-            conn.close()
-        except Exception:
-            pass
+        _release_conn(conn)
+
+
+_RE_NON_ALNUM = re.compile(r"[^a-z0-9]")
+_RE_MULTI_UND = re.compile(r"_+")
 
 
 def get_table_name(channel_name: str) -> str:
     """Convert a channel name to a safe PostgreSQL table name."""
-    import re
     # lowercase, replace spaces and special chars with underscores
-    safe = re.sub(r"[^a-z0-9]", "_", channel_name.lower())
+    safe = _RE_NON_ALNUM.sub("_", channel_name.lower())
     # collapse multiple underscores, strip leading/trailing
-    safe = re.sub(r"_+", "_", safe).strip("_")
+    safe = _RE_MULTI_UND.sub("_", safe).strip("_")
     return f"stream_{safe}"
 
 
@@ -275,16 +374,13 @@ def init_db() -> None:
     except Exception as e:
         log.error("DB init failed: %s", e)
     finally:
-        try:
-            conn.close()
-        except Exception:
-            pass
+        _release_conn(conn)
 
 
 def init_channel_table(channel_id: str, channel_name: str) -> Optional[str]:
     """
     Register channel and create its analytics table if needed.
-    Opens a fresh connection, runs DDL, closes immediately.
+    Borrows a pooled connection, runs DDL, hands it straight back.
     Returns the table name, or None on failure.
     """
     table = get_table_name(channel_name)
@@ -320,9 +416,16 @@ def init_channel_table(channel_id: str, channel_name: str) -> Optional[str]:
             cur.execute(f"""
                 ALTER TABLE {table} ADD COLUMN IF NOT EXISTS view_count BIGINT
             """)
+            # Covering (video_id, collected_at) index: serves both the per-video
+            # lookups the old single-column video_id index did and the
+            # dashboard's ordered timeseries reads as index-only scans. Same
+            # name as generate_dashboard.ensure_indexes() so neither side
+            # builds it twice. Tables created before this keep their old
+            # video_id index until ensure_indexes() drops it.
             cur.execute(f"""
-                CREATE INDEX IF NOT EXISTS idx_{table}_video_id
-                    ON {table}(video_id)
+                CREATE INDEX IF NOT EXISTS {f"idx_{table}_vid_ts"[:63]}
+                    ON {table}(video_id, collected_at)
+                    INCLUDE (concurrent_viewers, like_count, comment_count)
             """)
             cur.execute(f"""
                 CREATE INDEX IF NOT EXISTS idx_{table}_collected_at
@@ -334,84 +437,82 @@ def init_channel_table(channel_id: str, channel_name: str) -> Optional[str]:
         log.error("DB init_channel_table failed: %s", e)
         return None
     finally:
-        try:
-            conn.close()
-        except Exception:
-            pass
+        _release_conn(conn)
     
 def save_to_db(row: dict, table: str) -> None:
-    """Open a fresh connection, insert one analytics row, close immediately.
-    For bulk saves across multiple streams use save_many_to_db() instead."""
-    conn = _new_conn()
-    if conn is None:
-        return
-    try:
-        sql = f"""
-            INSERT INTO {table}
-                (collected_at, channel_id, channel_name, video_id, video_title,
-                 concurrent_viewers, view_count, like_count, comment_count, stream_status,
-                 scheduled_start, actual_start)
-            VALUES
-                (%(collected_at)s, %(channel_id)s, %(channel_name)s, %(video_id)s, %(video_title)s,
-                 %(concurrent_viewers)s, %(view_count)s, %(like_count)s, %(comment_count)s, %(stream_status)s,
-                 %(scheduled_start)s, %(actual_start)s)
-        """
-        with conn.cursor() as cur:
-            cur.execute(sql, row)
-        conn.commit()
-    except Exception as e:
-        log.error("DB save failed: %s", e)
-        try:
-            conn.rollback()
-        except Exception:
-            pass
-    finally:
-        try:
-            conn.close()
-        except Exception:
-            pass
+    """Insert one analytics row. Thin wrapper over save_many_to_db() so both
+    paths share the same batched INSERT."""
+    save_many_to_db([(row, table)])
+
+
+# Column order shared by the batched INSERT and the tuples built for it.
+_INSERT_COLUMNS = (
+    "collected_at", "channel_id", "channel_name", "video_id", "video_title",
+    "concurrent_viewers", "view_count", "like_count", "comment_count",
+    "stream_status", "scheduled_start", "actual_start",
+)
 
 
 def save_many_to_db(rows: list[tuple[dict, str]]) -> None:
     """Insert analytics rows for multiple streams in a single DB connection.
 
-    Each element of rows is (row_dict, table_name). All inserts are sent in
-    one round-trip, paying the TCP + SSL handshake cost only once per cycle
-    instead of once per live stream.
+    Each element of rows is (row_dict, table_name). Rows are grouped by table
+    and sent with execute_values — one multi-row INSERT per channel table
+    (paged at 1000 rows) instead of one statement per stream — followed by a
+    single commit for the whole cycle.
     """
     if not rows:
         return
-    conn = _new_conn()
-    if conn is None:
-        return
-    try:
-        with conn.cursor() as cur:
-            for row, table in rows:
-                sql = f"""
-                    INSERT INTO {table}
-                        (collected_at, channel_id, channel_name, video_id, video_title,
-                         concurrent_viewers, view_count, like_count, comment_count,
-                         stream_status, scheduled_start, actual_start)
-                    VALUES
-                        (%(collected_at)s, %(channel_id)s, %(channel_name)s, %(video_id)s,
-                         %(video_title)s, %(concurrent_viewers)s, %(view_count)s,
-                         %(like_count)s, %(comment_count)s, %(stream_status)s,
-                         %(scheduled_start)s, %(actual_start)s)
-                """
-                cur.execute(sql, row)
-        conn.commit()
-        log.info("DB: inserted %d row(s) in one connection.", len(rows))
-    except Exception as e:
-        log.error("DB batch save failed: %s", e)
-        try:
-            conn.rollback()
-        except Exception:
-            pass
-    finally:
+    by_table: dict[str, list[tuple]] = {}
+    for row, table in rows:
+        by_table.setdefault(table, []).append(
+            tuple(row.get(col) for col in _INSERT_COLUMNS)
+        )
+    # A pooled connection can look healthy yet have been dropped by Aiven
+    # while idle between cycles; the failure only shows on first use. The
+    # whole batch runs in one transaction, so nothing was written — discard
+    # that connection and retry the batch once on a fresh one rather than
+    # losing the cycle's rows.
+    for attempt in range(2):
+        conn = _new_conn()
+        if conn is None:
+            return
+        discard = False
         try:
-            conn.close()
-        except Exception:
-            pass
+            with conn.cursor() as cur:
+                for table, values in by_table.items():
+                    psycopg2.extras.execute_values(
+                        cur,
+                        f"INSERT INTO {table} ({', '.join(_INSERT_COLUMNS)}) VALUES %s",
+                        values,
+                        page_size=1000,
+                    )
+            conn.commit()
+            log.info("DB: inserted %d row(s) in one connection.", len(rows))
+            return
+        except psycopg2.extensions.QueryCanceledError as e:
+            # statement_timeout: the connection is fine, a retry would just
+            # wait out the timeout again.
+            log.error("DB batch save failed: %s", e)
+            try:
+                conn.rollback()
+            except Exception:
+                pass
+        except (psycopg2.OperationalError, psycopg2.InterfaceError) as e:
+            discard = True
+            if attempt == 0:
+                log.warning("DB batch save hit a dead connection (%s) — retrying once.", e)
+                continue
+            log.error("DB batch save failed: %s", e)
+        except Exception as e:
+            log.error("DB batch save failed: %s", e)
+            try:
+                conn.rollback()
+            except Exception:
+                pass
+        finally:
+            _release_conn(conn, discard=discard)
+        return
 
 # ══════════════════════════════════════════════════════════════════════════════
 # DASHBOARD DEPLOY TRIGGER
@@ -426,8 +527,6 @@ def save_many_to_db(rows: list[tuple[dict, str]]) -> None:
 # via deploy_dashboard_live.yml / deploy_dashboard_backfill.yml). tracker.py's
 # only remaining job is to fire the repository_dispatch trigger below.
 
-import subprocess
-
 
 def _notify_slow_cycle(elapsed: float, cycle_num: int) -> None:
     """Post a Discord warning when a single poll cycle exceeds SLOW_CYCLE_THRESHOLD_SEC.
@@ -540,13 +639,44 @@ CSV_FIELDS = [
 ]
 
 
+# The CSV is opened once and kept open for the tracker's lifetime instead of
+# being stat'ed, opened and closed for every sample. Rows accumulate in the
+# file buffer and are pushed to disk once per cycle by flush_csv().
+_csv_fh: Optional[io.TextIOWrapper] = None
+_csv_writer: Optional[csv.DictWriter] = None
+
+
 def save_to_csv(row: dict) -> None:
-    write_header = not os.path.exists(CSV_OUTPUT_PATH)
-    with open(CSV_OUTPUT_PATH, "a", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+    global _csv_fh, _csv_writer
+    if _csv_writer is None:
+        write_header = not os.path.exists(CSV_OUTPUT_PATH)
+        _csv_fh = open(CSV_OUTPUT_PATH, "a", newline="", encoding="utf-8",
+                       buffering=1 << 16)
+        _csv_writer = csv.DictWriter(_csv_fh, fieldnames=CSV_FIELDS,
+                                     extrasaction="ignore")
         if write_header:
-            writer.writeheader()
-        writer.writerow({k: row.get(k) for k in CSV_FIELDS})
+            _csv_writer.writeheader()
+    _csv_writer.writerow(row)
+
+
+def flush_csv() -> None:
+    """Push buffered CSV rows to disk. Called once per cycle from run()."""
+    if _csv_fh is not None:
+        try:
+            _csv_fh.flush()
+        except Exception as e:
+            log.warning("CSV flush failed: %s", e)
+
+
+def close_csv() -> None:
+    """Flush and close the CSV handle. Called once when run() exits."""
+    global _csv_fh, _csv_writer
+    if _csv_fh is not None:
+        try:
+            _csv_fh.close()
+        except Exception as e:
+            log.warning("CSV close failed: %s", e)
+        _csv_fh = _csv_writer = None
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -556,36 +686,48 @@ def save_to_csv(row: dict) -> None:
 def find_live_videos(channel_id: str) -> list[dict]:
     """
     Use activities.list (1 unit) instead of search.list (100 units)
-    to detect live streams on a channel.
+    to detect live streams on a channel, then resolve all uploads in a
+    single batched videos.list call (1 unit) to read their live status.
     Rotates to the next API key automatically on a 403 quota error.
+
+    Runs on the channel-scan worker threads, so it uses a per-thread client
+    (_scan_client) rather than the shared module-level one.
     """
-    global youtube
     results = []
     for attempt in range(len(YOUTUBE_API_KEYS)):
+        key    = _current_key()
+        client = _scan_client(key)
         try:
-            resp = youtube.activities().list(
+            resp = client.activities().list(
                 part="snippet,contentDetails",
                 channelId=channel_id,
                 maxResults=10,
             ).execute()
 
-            for item in resp.get("items", []):
-                details = item.get("contentDetails", {})
-                upload  = details.get("upload", {})
-                video_id = upload.get("videoId")
-                if not video_id:
-                    continue
+            # Collect every upload ID first and resolve them with ONE
+            # videos.list call (up to 50 IDs, still 1 unit) instead of one
+            # call per activity item. dict.fromkeys de-duplicates while
+            # keeping activities.list order.
+            upload_ids = list(dict.fromkeys(
+                vid for item in resp.get("items", [])
+                if (vid := item.get("contentDetails", {}).get("upload", {}).get("videoId"))
+            ))
+            if not upload_ids:
+                return results
+
+            video_resp = client.videos().list(
+                part="snippet,liveStreamingDetails",
+                id=",".join(upload_ids[:50]),
+            ).execute()
+            video_items = {v["id"]: v for v in video_resp.get("items", [])}
 
-                video_resp = youtube.videos().list(
-                    part="snippet,liveStreamingDetails",
-                    id=video_id,
-                ).execute()
-                video_items = video_resp.get("items", [])
-                if not video_items:
+            for video_id in upload_ids:
+                video = video_items.get(video_id)
+                if video is None:
                     continue
 
-                snippet          = video_items[0].get("snippet", {})
-                live_details     = video_items[0].get("liveStreamingDetails", {})
+                snippet          = video.get("snippet", {})
+                live_details     = video.get("liveStreamingDetails", {})
                 broadcast_status = snippet.get("liveBroadcastContent")
                 if broadcast_status not in ("live", "upcoming"):
                     continue
@@ -603,9 +745,8 @@ def find_live_videos(channel_id: str) -> list[dict]:
         except HttpError as e:
             if e.resp.status == 403:
                 log.warning("403 on find_live_videos (key index %d): %s", _key_index, e)
-                if not _mark_exhausted():
+                if not _rotate_after_403(key):
                     return results   # all keys exhausted
-                youtube = _build_client(_current_key())
                 continue            # retry with new key
             log.error("activities API error for %s: %s", channel_id, e)
             return results
@@ -778,14 +919,15 @@ def collect_and_store(stream: dict, table: str, analytics: dict) -> None:
     stream.update(analytics)
     stream["collected_at"] = datetime.now(timezone.utc).isoformat()
 
-    history.setdefault(video_id, []).append((
+    points = history.get(video_id)
+    if points is None:
+        points = history[video_id] = deque(maxlen=MAX_HISTORY_POINTS)
+    points.append((
         stream["collected_at"],
         analytics["concurrent_viewers"],
         analytics["like_count"],
         analytics["comment_count"],
     ))
-    if len(history[video_id]) > MAX_HISTORY_POINTS:
-        history[video_id].pop(0)
 
     save_to_csv(stream)
     # DB write is handled in run() via save_many_to_db() so all streams
@@ -817,10 +959,7 @@ def load_channel_tables_from_db() -> dict[str, str]:
         log.error("Could not load channel tables from DB: %s", e)
         return {}
     finally:
-        try:
-            conn.close()
-        except Exception:
-            pass
+        _release_conn(conn)
 
 
 def ensure_all_channel_tables(existing: dict[str, str]) -> dict[str, str]:
@@ -924,6 +1063,7 @@ def _run_dashboard_in_background() -> None:
 
 
 def run() -> None:
+    global youtube
     log.info("Tracker starting. Monitoring channels: %s", CHANNEL_IDS)
     if AIVEN_DATABASE_URL:
         init_db()
@@ -951,22 +1091,35 @@ def run() -> None:
     DEPLOY_INTERVAL_SEC = int(os.environ.get("DEPLOY_INTERVAL_SEC", "900"))
     channel_poll_counter = 0
     cycle_num = 0
+    # Lives for the whole run so each worker's per-thread API client is
+    # built once and reused across scans.
+    scan_pool = ThreadPoolExecutor(
+        max_workers=max(1, min(SCAN_WORKERS, len(CHANNEL_IDS))),
+        thread_name_prefix="channel-scan",
+    )
 
     log.info("Scanning for streams…")
 
     while _running:
         try:
             # ── activities.list channel scan (every POLL_INTERVAL_SEC) ────
-            # Timed separately from the rest of the cycle. The scan is a long
-            # sequential HTTP loop (up to 2 minutes for 209 channels) and is
-            # excluded from the slow-cycle elapsed window so the alert only
-            # fires for problems in the analytics/DB/dashboard work, not for
-            # the expected scan cost.
+            # Timed separately from the rest of the cycle. The scan is still
+            # two HTTP round-trips per channel (fanned out over SCAN_WORKERS
+            # threads) and is excluded from the slow-cycle elapsed window so
+            # the alert only fires for problems in the analytics/DB/dashboard
+            # work, not for the expected scan cost.
             if channel_poll_counter == 0:
                 scan_start = datetime.now(timezone.utc)
+                key_before = _current_key()
+                found = list(scan_pool.map(find_live_videos, CHANNEL_IDS))
+                if _current_key() != key_before:
+                    # A scan worker rotated keys; keep the shared client used
+                    # by the rest of the cycle on the same key.
+                    youtube = _build_client(_current_key())
+                # DB work and logging stay on this thread, in CHANNEL_IDS order.
                 discovered: dict[str, dict] = {}
-                for ch in CHANNEL_IDS:
-                    for s in find_live_videos(ch):
+                for ch, streams in zip(CHANNEL_IDS, found):
+                    for s in streams:
                         vid = s["video_id"]
                         discovered[vid] = s
                         if AIVEN_DATABASE_URL and ch not in channel_tables:
@@ -1199,6 +1352,7 @@ def run() -> None:
         # ── Step 3: flush all DB rows in one connection ───────────────────
         if db_batch:
             save_many_to_db(db_batch)
+        flush_csv()
 
         # ── Step 4: deploy dashboard trigger (non-blocking) ───────────────
         # deploy_dashboard() is now a single fast HTTP POST (repository_dispatch),
@@ -1233,6 +1387,9 @@ def run() -> None:
             _notify_slow_cycle(elapsed, cycle_num)
         time.sleep(remaining)
 
+    scan_pool.shutdown(wait=False, cancel_futures=True)
+    close_pool()
+    close_csv()
     log.info("Tracker stopped.")
 
 if __name__ == "__main__":